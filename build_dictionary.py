@@ -0,0 +1,52 @@
+"""
+Prebuild the dictionary used by pdf_text_cleanup's broken-word repair.
+
+Loads the base word list (english-words, NLTK or the system dictionary),
+expands it with inflected forms and writes the result next to
+pdf_text_cleanup.py: ``english_dictionary.marisa`` when marisa-trie is
+installed, ``english_dictionary.pkl`` otherwise.  From then on
+pdf_text_cleanup loads that file directly at start-up (memory-mapping the
+trie), without importing any word-list package or re-running the expansion.
+
+Usage:
+    python build_dictionary.py [-o OUTPUT]
+"""
+
+import argparse
+import logging
+import sys
+
+from pdf_text_cleanup import write_dictionary_asset
+
+log = logging.getLogger(__name__)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Prebuild the English dictionary for pdf_text_cleanup.",
+    )
+    parser.add_argument(
+        "-o", "--output",
+        help="Output file path; a .marisa suffix writes a MARISA trie "
+             "(default: english_dictionary.marisa or .pkl next to pdf_text_cleanup.py)",
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(levelname)s: %(message)s",
+        stream=sys.stderr,
+    )
+
+    try:
+        written = write_dictionary_asset(args.output)
+    except ImportError:
+        log.error("Writing a .marisa dictionary needs marisa-trie — install it or use a .pkl output")
+        sys.exit(1)
+    if not written:
+        log.error("No dictionary source found — install english-words or nltk first")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,9 @@
+"""Shared pytest configuration."""
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _no_dictionary_cache(monkeypatch):
+    """Keep the test run from writing a dictionary cache under ~/.cache."""
+    monkeypatch.setenv("ASTRO_DICT_CACHE", "0")
@@ -16,8 +16,21 @@ Usage:
     cleaned_text = clean_broken_words(raw_text)
 """
 
+import contextlib
+import functools
+import gc
+import hashlib
 import logging
+import os
+import pickle
 import re
+import sys
+import tempfile
+import threading
+from collections import deque
+from collections.abc import Callable, Collection, Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import chain, product, repeat
 from pathlib import Path
 
 log = logging.getLogger(__name__)
@@ -27,12 +40,29 @@ log = logging.getLogger(__name__)
 # Dictionary loading
 # ---------------------------------------------------------------------------
 
-_dictionary: set[str] | None = None
+_dictionary: Collection[str] | None = None
+# Held while loading, so concurrent first calls load the dictionary once.
+_dictionary_lock = threading.Lock()
+
+# Prebuilt, inflection-expanded dictionary written by build_dictionary.py:
+# a MARISA trie when marisa-trie is installed, else a pickled frozenset.
+# When present it is loaded as-is and no word-list package is imported.
+_TRIE_ASSET = Path(__file__).with_name("english_dictionary.marisa")
+_DICT_ASSET = Path(__file__).with_name("english_dictionary.pkl")
+
+# Where the inflection-expanded dictionary is cached between runs.  Set
+# ASTRO_DICT_CACHE=0 to neither read nor write it (e.g. in tests).
+_CACHE_DIR = Path.home() / ".cache" / "astro-agent"
 
 # Common English inflectional suffixes used to expand the base dictionary.
 _INFLECTION_SUFFIXES = ["s", "es", "ed", "ing", "er", "est", "ly", "ness", "ment", "tion", "ation"]
 
 
+# Letter classes for the consonant-doubling rule below.
+_VOWELS = frozenset("aeiou")
+_VOWELS_Y = frozenset("aeiouy")
+
+
 def _expand_with_inflections(base_words: set[str]) -> set[str]:
     """
     Given a set of base-form words, generate common inflected forms.
@@ -40,32 +70,214 @@ def _expand_with_inflections(base_words: set[str]) -> set[str]:
     Many dictionary sources (like gcide) only include base forms, so words
     like "words", "files", "affects" are missing.  This adds them.
     """
+    # Classify the words in one pass, then add each suffix for a whole list
+    # at a time: set.update() runs the loop in C, leaving only the string
+    # concatenation in Python.
+    stems = [w for w in base_words if len(w) >= 3 and w.isalpha()]
+    # Consonant doubling: run → running, fit → fitted
+    doubled = [
+        w + w[-1] for w in stems
+        if w[-1] not in _VOWELS_Y and w[-2] in _VOWELS and w[-3] not in _VOWELS
+    ]
+    # Silent-e dropping: file → filing, make → making
+    e_dropped = [w[:-1] for w in stems if w[-1] == "e"]
+
     expanded = set(base_words)
-    for word in base_words:
-        if not word.isalpha() or len(word) < 3:
-            continue
-        for suffix in _INFLECTION_SUFFIXES:
-            expanded.add(word + suffix)
-        # Handle consonant doubling: run → running, fit → fitted
-        if len(word) >= 3 and word[-1] not in "aeiouy" and word[-2] in "aeiou" and word[-3] not in "aeiou":
-            doubled = word + word[-1]
-            expanded.add(doubled + "ing")
-            expanded.add(doubled + "ed")
-            expanded.add(doubled + "er")
-            expanded.add(doubled + "est")
-        # Handle silent-e dropping: file → filing, make → making
-        if word.endswith("e"):
-            stem = word[:-1]
-            expanded.add(stem + "ing")
-            expanded.add(stem + "ed")
-            expanded.add(stem + "er")
-            expanded.add(stem + "est")
-            expanded.add(stem + "ation")
+    for suffix in _INFLECTION_SUFFIXES:
+        expanded.update([w + suffix for w in stems])
+    for suffix in ("ing", "ed", "er", "est"):
+        expanded.update([w + suffix for w in doubled])
+    for suffix in ("ing", "ed", "er", "est", "ation"):
+        expanded.update([w + suffix for w in e_dropped])
+    return expanded
+
+
+def _expand_cached(base_words: set[str]) -> set[str]:
+    """
+    Return ``_expand_with_inflections(base_words)``, reusing an on-disk copy.
+
+    Expanding a ~250k-word list takes over a second of pure-Python work on
+    every start; unpickling the result is roughly twice as fast.  The cache
+    file is keyed by a hash of the base word list, so a different source or
+    an updated package produces a fresh file.
+    """
+    if not _cache_enabled():
+        return _expand_with_inflections(base_words)
+    cache_path = _CACHE_DIR / f"dict-{_word_list_digest(base_words)}.pkl"
+
+    try:
+        with open(cache_path, "rb") as f:
+            expanded = pickle.load(f)
+        log.info(f"Loaded expanded dictionary from {cache_path}")
+        return expanded
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        log.warning(f"Ignoring unreadable dictionary cache {cache_path} ({e})")
+
+    expanded = _expand_with_inflections(base_words)
+    try:
+        _replace_atomically(cache_path, lambda tmp: _pickle_to(tmp, expanded))
+    except OSError as e:
+        log.warning(f"Could not write dictionary cache {cache_path} ({e})")
+    else:
+        _remove_stale_caches(cache_path)
     return expanded
 
 
-def _load_dictionary() -> set[str]:
+def _trie_cached(base_words: set[str]) -> Collection[str] | None:
+    """
+    MARISA-trie counterpart of :func:`_expand_cached`, used when
+    ``marisa-trie`` is installed (returns ``None`` otherwise).
+
+    The expanded words are saved as a trie file and memory-mapped on later
+    runs: nothing is parsed or unpickled at start-up, and the mapped pages
+    are shared by every process that loads the same file.
+    """
+    try:
+        import marisa_trie
+    except ImportError:
+        return None
+    if not _cache_enabled():
+        return _pack_trie(_expand_with_inflections(base_words))
+    cache_path = _CACHE_DIR / f"dict-{_word_list_digest(base_words)}.marisa"
+
+    if cache_path.exists():
+        try:
+            trie = _mmap_trie(cache_path)
+            log.info(f"Memory-mapped expanded dictionary from {cache_path}")
+            return trie
+        except Exception as e:
+            log.warning(f"Ignoring unreadable dictionary cache {cache_path} ({e})")
+
+    trie = _pack_trie(_expand_with_inflections(base_words))
+    try:
+        _replace_atomically(cache_path, trie.save)
+    # marisa reports I/O failures with its own exception types.
+    except Exception as e:
+        log.warning(f"Could not write dictionary cache {cache_path} ({e})")
+    else:
+        _remove_stale_caches(cache_path)
+    return trie
+
+
+def _pack_trie(words: Iterable[str]) -> Collection[str]:
+    """
+    Pack *words* into a MARISA trie (``marisa-trie`` must be installed).
+
+    Millions of separately allocated ``str`` objects in a ``set`` cost a few
+    hundred MB of RSS; the trie holds the same words in a few MB and still
+    supports ``word in trie``.
+    """
+    import marisa_trie
+    trie = marisa_trie.Trie(words)
+    log.info(f"Packed dictionary into a MARISA trie ({len(trie)} words)")
+    return trie
+
+
+def _mmap_trie(path: Path) -> Collection[str]:
+    """Memory-map a trie file written by ``Trie.save`` (needs ``marisa-trie``)."""
+    import marisa_trie
+    trie = marisa_trie.Trie()
+    trie.mmap(str(path))
+    return trie
+
+
+def _unpickle_words(path: Path) -> Collection[str]:
+    with open(path, "rb") as f:
+        return frozenset(pickle.load(f))
+
+
+def _cache_enabled() -> bool:
+    return os.environ.get("ASTRO_DICT_CACHE", "1") != "0"
+
+
+def _word_list_digest(base_words: set[str]) -> str:
+    """
+    Cache key for a base word list: changes whenever any word, or the
+    suffix list it is expanded with, does.
+    """
+    h = hashlib.sha1("\n".join(sorted(base_words)).encode())
+    h.update(repr(_INFLECTION_SUFFIXES).encode())
+    return h.hexdigest()[:16]
+
+
+def _replace_atomically(path: Path, save: Callable[[str], None]) -> None:
+    """
+    Write *path* by calling ``save(tmp_path)`` on a temporary file beside it
+    and renaming that into place, so a concurrent reader — another process
+    starting up — sees either no file or a complete one.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile(dir=path.parent, prefix=f".{path.name}.", delete=False) as f:
+        tmp = f.name
+    try:
+        save(tmp)
+        # Temporary files are created private (0600); give the result the
+        # usual permissions of a data file.
+        os.chmod(tmp, 0o644)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def _remove_stale_caches(current: Path) -> None:
+    """
+    Delete the cache files of the same kind as *current* left by other word
+    lists or suffix lists — each one is tens of MB and would never be read
+    again.
+    """
+    for path in current.parent.glob(f"dict-*{current.suffix}"):
+        if path != current:
+            try:
+                path.unlink()
+            except OSError as e:
+                log.warning(f"Could not remove stale dictionary cache {path} ({e})")
+
+
+def _pickle_to(path: str | Path, obj: object) -> None:
+    with open(path, "wb") as f:
+        pickle.dump(obj, f, protocol=5)
+
+
+def _load_dictionary() -> Collection[str]:
     """Load an English word set from the best available source."""
+    # 0. Prebuilt dictionary (see build_dictionary.py) — already expanded,
+    # and needs none of the word-list packages below.  The trie form is
+    # memory-mapped, so there is nothing to parse at start-up.
+    for path, load in ((_TRIE_ASSET, _mmap_trie), (_DICT_ASSET, _unpickle_words)):
+        if not path.exists():
+            continue
+        try:
+            words = load(path)
+        except ImportError:
+            log.info(f"marisa-trie not available, skipping {path.name}")
+            continue
+        except Exception as e:
+            log.warning(f"Ignoring unreadable prebuilt dictionary {path} ({e})")
+            continue
+        log.info(f"Loaded prebuilt dictionary with {len(words)} words ({path.name})")
+        return words
+
+    words = _load_base_words()
+    if not words:
+        log.warning("No dictionary source found — broken-word repair will rely on heuristics only")
+        return frozenset()
+
+    # Expand with inflected forms to cover plurals, verb forms, etc.
+    trie = _trie_cached(words)
+    if trie is not None:
+        log.info(f"Dictionary expanded from {len(words)} to {len(trie)} words (with inflections)")
+        return trie
+    expanded = _expand_cached(words)
+    log.info(f"Dictionary expanded from {len(words)} to {len(expanded)} words (with inflections)")
+    # A frozenset is safe to share read-only with forked worker processes.
+    return frozenset(expanded)
+
+
+def _load_base_words() -> set[str]:
+    """Load the base-form English word list from the first available source."""
     words: set[str] = set()
 
     # 1. english-words package (installed as a dependency)
@@ -99,26 +311,70 @@ def _load_dictionary() -> set[str]:
             except FileNotFoundError:
                 continue
 
-    if not words:
-        log.warning("No dictionary source found — broken-word repair will rely on heuristics only")
-        return set()
+    return words
 
-    # Expand with inflected forms to cover plurals, verb forms, etc.
+
+def write_dictionary_asset(path: str | Path | None = None) -> int:
+    """
+    Build the inflection-expanded dictionary from the base word list and
+    write it to *path*: as a MARISA trie if the name ends in ``.marisa``,
+    otherwise as a pickled frozenset.  The default is the prebuilt asset next
+    to this module, in trie form when ``marisa-trie`` is installed.
+
+    Returns the number of words written, or 0 if no word source was found.
+    """
+    if path is None:
+        try:
+            import marisa_trie
+            path = _TRIE_ASSET
+        except ImportError:
+            path = _DICT_ASSET
+    path = Path(path)
+    words = _load_base_words()
+    if not words:
+        return 0
     expanded = _expand_with_inflections(words)
-    log.info(f"Dictionary expanded from {len(words)} to {len(expanded)} words (with inflections)")
-    return expanded
+    if path.suffix == ".marisa":
+        trie = _pack_trie(expanded)
+        _replace_atomically(path, trie.save)
+    else:
+        expanded = frozenset(expanded)
+        _replace_atomically(path, lambda tmp: _pickle_to(tmp, expanded))
+    log.info(f"Wrote prebuilt dictionary with {len(expanded)} words to {path}")
+    return len(expanded)
 
 
-def get_dictionary() -> set[str]:
+def get_dictionary() -> Collection[str]:
     """Return the cached dictionary, loading it on first call."""
     global _dictionary
     if _dictionary is None:
-        _dictionary = _load_dictionary()
+        with _dictionary_lock:
+            if _dictionary is None:
+                dictionary = _load_dictionary()
+                # Memoized answers from a previously loaded dictionary are stale.
+                is_word.cache_clear()
+                _should_merge.cache_clear()
+                _clean_line.cache_clear()
+                # Publish only once everything above is done.
+                _dictionary = dictionary
     return _dictionary
 
 
+# A book-length text has tens of thousands of distinct fragments; this
+# keeps all of them plus their merge candidates.
+@functools.lru_cache(maxsize=262144)
 def is_word(token: str) -> bool:
-    """Check whether *token* is a recognized English word."""
+    """
+    Check whether *token* is a recognized English word.
+
+    Memoized: the same short fragments ("fi", "the", "a", …) are checked over
+    and over, and the dictionary never changes once loaded.
+    """
+    return _lookup_word(token)
+
+
+def _lookup_word(token: str) -> bool:
+    """Uncached dictionary lookup behind :func:`is_word`."""
     return token.lower() in get_dictionary()
 
 
@@ -126,7 +382,23 @@ def is_word(token: str) -> bool:
 # PDF text extraction
 # ---------------------------------------------------------------------------
 
-def extract_text_from_pdf(pdf_path: str | Path, page_range: tuple[int, int] | None = None) -> str:
+# Default number of worker processes for page extraction.
+_DEFAULT_WORKERS = min(os.cpu_count() or 1, 4)
+
+# Pages handed to a worker process per task — enough that process start-up
+# and re-opening the PDF don't dominate the actual parsing.
+_PAGES_PER_TASK = 10
+
+# Shorter page ranges are parsed in-process: for them, starting the pool and
+# opening the PDF once per worker costs more than the parallelism saves.
+_MIN_PARALLEL_PAGES = 50
+
+
+def extract_text_from_pdf(
+    pdf_path: str | Path,
+    page_range: tuple[int, int] | None = None,
+    num_workers: int = _DEFAULT_WORKERS,
+) -> str:
     """
     Extract raw text from a PDF file.
 
@@ -138,60 +410,142 @@ def extract_text_from_pdf(pdf_path: str | Path, page_range: tuple[int, int] | No
         Path to the PDF file.
     page_range : tuple(start, end), optional
         0-indexed inclusive page range.  ``None`` means all pages.
+    num_workers : int
+        Number of processes to parse pages in.  ``1`` extracts in-process.
 
     Returns
     -------
     str
         The concatenated raw text of the selected pages.
     """
+    return "\n\n".join(iter_pdf_pages(pdf_path, page_range=page_range, num_workers=num_workers))
+
+
+def iter_pdf_pages(
+    pdf_path: str | Path,
+    page_range: tuple[int, int] | None = None,
+    num_workers: int = _DEFAULT_WORKERS,
+) -> Iterator[str]:
+    """
+    Yield the raw text of each non-empty page of a PDF, in page order.
+
+    Streaming form of :func:`extract_text_from_pdf` (same parameters): the
+    document is never held as one string.  If pdfplumber fails part-way
+    through, pypdf picks up from the page it failed on.
+    """
     pdf_path = Path(pdf_path)
     if not pdf_path.exists():
         raise FileNotFoundError(f"PDF not found: {pdf_path}")
 
+    start = max(0, page_range[0]) if page_range is not None else 0
+    end = page_range[1] if page_range is not None else sys.maxsize
+
     # Try pdfplumber first, fall back to pypdf
     try:
         import pdfplumber
-        return _extract_with_pdfplumber(pdf_path, page_range)
+        for text in _iter_pages("pdfplumber", _pdfplumber_pages, pdf_path, start, end, num_workers):
+            start += 1
+            if text:
+                yield text
+        return
     except ImportError:
         log.info("pdfplumber not available, using pypdf")
     except Exception as e:
         log.warning(f"pdfplumber failed ({e}), falling back to pypdf")
 
-    return _extract_with_pypdf(pdf_path, page_range)
+    for text in _iter_pages("pypdf", _pypdf_pages, pdf_path, start, end, num_workers):
+        if text:
+            yield text
+
+
+def _iter_pages(
+    backend: str,
+    extract: Callable[[Path, int, int], Iterator[str]],
+    pdf_path: Path,
+    start: int,
+    end: int,
+    num_workers: int,
+) -> Iterator[str]:
+    """
+    Yield the text of pages *start*–*end* (inclusive, clamped to the
+    document) as produced by ``extract(pdf_path, first, stop)``.
+
+    With more than one worker and at least ``_MIN_PARALLEL_PAGES`` pages, the
+    range is cut into batches of ``_PAGES_PER_TASK`` pages and parsed in a
+    process pool, with at most ``2 * num_workers`` batches in flight.  Parser
+    objects aren't picklable, so *extract* opens the PDF itself in each worker.
+    """
+    end = min(end, _page_count(backend, pdf_path) - 1)
+    executor = None
+    if num_workers <= 1 or end - start + 1 < _MIN_PARALLEL_PAGES:
+        pages = extract(pdf_path, start, end + 1)
+    else:
+        firsts = range(start, end + 1, _PAGES_PER_TASK)
+        stops = [min(first + _PAGES_PER_TASK, end + 1) for first in firsts]
+        executor = ProcessPoolExecutor(max_workers=min(num_workers, len(firsts)))
+        batches = _bounded_map(
+            executor, _collect_pages, repeat(extract), repeat(pdf_path), firsts, stops,
+            limit=2 * num_workers,
+        )
+        pages = (text for batch in batches for text in batch)
+
+    chars = 0
+    try:
+        for text in pages:
+            chars += len(text)
+            yield text
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+    log.info(f"Extracted {chars} chars from {pdf_path.name} pages {start}-{end} ({backend})")
+
+
+def _bounded_map(executor: ProcessPoolExecutor, fn: Callable, *iterables: Iterable, limit: int) -> Iterator:
+    """
+    ``executor.map`` with back-pressure: yield ``fn(*args)`` in order, with
+    at most *limit* tasks submitted but not yet consumed, so a slow consumer
+    never has the whole input's results queued up in memory.
+    """
+    pending: deque[Future] = deque()
+    for args in zip(*iterables):
+        pending.append(executor.submit(fn, *args))
+        if len(pending) >= limit:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def _collect_pages(extract: Callable[[Path, int, int], Iterator[str]], pdf_path: Path, first: int, stop: int) -> list[str]:
+    """Worker-side wrapper: run *extract* over one batch and return it whole."""
+    return list(extract(pdf_path, first, stop))
+
+
+def _page_count(backend: str, pdf_path: Path) -> int:
+    if backend == "pdfplumber":
+        import pdfplumber
+        with pdfplumber.open(pdf_path) as pdf:
+            return len(pdf.pages)
+    from pypdf import PdfReader
+    return len(PdfReader(pdf_path).pages)
 
 
-def _extract_with_pdfplumber(pdf_path: Path, page_range: tuple[int, int] | None) -> str:
+def _pdfplumber_pages(pdf_path: Path, first: int, stop: int) -> Iterator[str]:
     import pdfplumber
-    pages_text: list[str] = []
     with pdfplumber.open(pdf_path) as pdf:
-        total = len(pdf.pages)
-        start, end = 0, total - 1
-        if page_range is not None:
-            start, end = max(0, page_range[0]), min(total - 1, page_range[1])
-        for idx in range(start, end + 1):
-            text = pdf.pages[idx].extract_text()
-            if text:
-                pages_text.append(text)
-    raw = "\n\n".join(pages_text)
-    log.info(f"Extracted {len(raw)} chars from {pdf_path.name} pages {start}-{end} (pdfplumber)")
-    return raw
+        for idx in range(first, stop):
+            page = pdf.pages[idx]
+            text = page.extract_text() or ""
+            # pdf.pages keeps every Page alive, along with its parsed chars,
+            # objects and text map; drop those so memory stays O(page).
+            page.close()
+            yield text
 
 
-def _extract_with_pypdf(pdf_path: Path, page_range: tuple[int, int] | None) -> str:
+def _pypdf_pages(pdf_path: Path, first: int, stop: int) -> Iterator[str]:
     from pypdf import PdfReader
     reader = PdfReader(pdf_path)
-    total = len(reader.pages)
-    start, end = 0, total - 1
-    if page_range is not None:
-        start, end = max(0, page_range[0]), min(total - 1, page_range[1])
-    pages_text: list[str] = []
-    for idx in range(start, end + 1):
-        text = reader.pages[idx].extract_text()
-        if text:
-            pages_text.append(text)
-    raw = "\n\n".join(pages_text)
-    log.info(f"Extracted {len(raw)} chars from {pdf_path.name} pages {start}-{end} (pypdf)")
-    return raw
+    for idx in range(first, stop):
+        yield reader.pages[idx].extract_text() or ""
 
 
 # ---------------------------------------------------------------------------
@@ -211,9 +565,6 @@ _LIGATURE_MAP = {
     "\ufb06": "st",   # ﬆ
 }
 
-# Pre-compiled regex for all ligature characters.
-_LIGATURE_RE = re.compile("|".join(re.escape(k) for k in _LIGATURE_MAP))
-
 
 def normalize_ligatures(text: str) -> str:
     """
@@ -223,11 +574,13 @@ def normalize_ligatures(text: str) -> str:
 
     Example: ``"proﬁ table"``  →  ``"profitable"``
     """
-    def _replace(m: re.Match) -> str:
-        return _LIGATURE_MAP[m.group(0)]
-
-    # Step 1: replace the ligature char with ASCII letters
-    text = _LIGATURE_RE.sub(_replace, text)
+    # Step 1: replace the ligature char with ASCII letters.  A substring test
+    # and str.replace() per ligature run entirely in C; pure-ASCII text (the
+    # common case) can't contain any and is returned untouched.
+    if not text.isascii():
+        for lig, letters in _LIGATURE_MAP.items():
+            if lig in text:
+                text = text.replace(lig, letters)
     # Step 2: after replacement the space that was "inside" the ligature break
     # may now sit between two letter runs.  We collapse it only when the space
     # is flanked by word characters on both sides (i.e. it was an intra-word
@@ -246,31 +599,47 @@ def normalize_ligatures(text: str) -> str:
 _MAX_MERGE_WINDOW = 3
 
 
-def _strip_punctuation(token: str) -> tuple[str, str, str]:
-    """
-    Split a token into (leading_punct, alpha_core, trailing_punct).
-
-    Examples:
-        "hello"  → ("", "hello", "")
-        "le."    → ("", "le", ".")
-        "(word)" → ("(", "word", ")")
-        '"Hi!'   → ('"', "Hi", "!")
-    """
-    start = 0
-    end = len(token)
-    while start < end and not token[start].isalpha():
-        start += 1
-    while end > start and not token[end - 1].isalpha():
-        end -= 1
-    return token[:start], token[start:end], token[end:]
-
-
-def _is_fragment(core: str) -> bool:
-    """Return True if *core* is a non-empty alphabetic string (a word fragment candidate)."""
-    return bool(core) and core.isalpha()
-
-
-def _should_merge(fragments: list[str], max_short: int) -> bool:
+# Numeric characters that aren't decimal digits — superscripts ("²"),
+# vulgar fractions ("½") and the like.  ``[^\W\d_]`` counts them as letters
+# while ``str.isalpha`` doesn't; they must split off as punctuation so that a
+# footnote marker in "rst²" is handled like a full stop.  None exist above
+# U+1FFFF, so the scan stops there.
+_NUMERIC_NON_DIGITS = frozenset(
+    c for c in filter(str.isnumeric, map(chr, range(0x20000)))
+    if not c.isalpha() and not c.isdecimal()
+)
+_NUMERIC_CLASS = re.escape("".join(sorted(_NUMERIC_NON_DIGITS)))
+
+# Exact regex spelling of "letter" (``str.isalpha``).
+_LETTER = rf"[^\W\d_{_NUMERIC_CLASS}]"
+
+
+# Splits a whole line into (leading_punct, alpha_core, trailing_punct)
+# tokens in one sweep.  Each match is one
+# space-delimited token plus the run of spaces after it (the "gap"), so runs
+# of spaces don't turn into empty tokens.  Matching against ``line + " "``
+# gives every token a gap; concatenating all matches rebuilds the line plus
+# that one extra space.  Groups: whole match, pre, core, suf, gap.
+#
+# Only tokens whose core is all letters — the word-fragment candidates — are
+# split; anything else ("don't", "x-ray", "12ab") can't take part in a merge
+# and matches whole, with empty parts.  A non-empty core is thus a fragment.
+_TOKEN_PATTERN = r"((?:({punct}*)({letter}+)({punct}*)(?= )|[^ ]*)( +))"
+_TOKEN_RE = re.compile(_TOKEN_PATTERN.format(letter=r"[^\W\d_]", punct=r"(?:[^\w ]|[\d_])"))
+# For pure-ASCII lines — nearly all of them once ligatures are normalized —
+# plain character sets replace the Unicode category tests: twice as fast.
+_ASCII_TOKEN_RE = re.compile(_TOKEN_PATTERN.format(letter="[A-Za-z]", punct="[^A-Za-z ]"))
+# Exact but far slower (the engine tests every range of the class on every
+# character), so only used for lines containing _NUMERIC_NON_DIGITS.
+_EXACT_TOKEN_RE = re.compile(_TOKEN_PATTERN.format(
+    letter=_LETTER, punct=rf"(?:[^\w ]|[\d_{_NUMERIC_CLASS}])",
+))
+
+
+# The same fragment pairs and triples ("the re", "in g") come up again and
+# again across a document, so whole decisions are memoized.
+@functools.lru_cache(maxsize=131072)
+def _should_merge(fragments: tuple[str, ...], max_short: int) -> bool:
     """
     Decide whether merging *fragments* is appropriate.
 
@@ -279,12 +648,13 @@ def _should_merge(fragments: list[str], max_short: int) -> bool:
     - At least one fragment is short (≤ *max_short* chars), AND
     - NOT all fragments are independently valid words.
     """
-    candidate = "".join(fragments)
-    if not is_word(candidate):
+    # Cheapest test first: most windows have no short fragment at all, and
+    # rejecting them here avoids building and looking up the concatenation.
+    if not any(len(f) <= max_short for f in fragments):
+        return False
+    if not is_word("".join(fragments)):
         return False
-    has_short = any(len(f) <= max_short for f in fragments)
-    all_real = all(is_word(f) for f in fragments)
-    return has_short and not all_real
+    return not all(is_word(f) for f in fragments)
 
 
 # Ligature fragment endings — when a token ends with one of these and the
@@ -292,12 +662,41 @@ def _should_merge(fragments: list[str], max_short: int) -> bool:
 # ligature break regardless of fragment length.
 _LIGATURE_ENDINGS = ("fi", "fl", "ff", "ffi", "ffl", "ft", "ct", "st")
 
+
+def _ending_groups(endings: Iterable[str]) -> tuple[tuple[int, frozenset[str]], ...]:
+    """
+    Reduce *endings* to the ones that aren't implied by a shorter ending
+    (anything ending in "ffi" also ends in "fi"), grouped by length: a word
+    has one of the endings iff, for some group, its last ``size`` characters
+    are in that group's set.
+    """
+    endings = set(endings)
+    minimal = {e for e in endings if not any(e != o and e.endswith(o) for o in endings)}
+    return tuple(
+        (size, frozenset(e for e in minimal if len(e) == size))
+        for size in sorted({len(e) for e in minimal})
+    )
+
+
+# _LIGATURE_ENDINGS as (size, tails) groups — currently the single group of
+# 2-char endings, so a boundary test is one slice and one set lookup.
+_LIGATURE_TAILS = _ending_groups(_LIGATURE_ENDINGS)
+
 # Standalone ligature fragments that appear as the entire left token.
 # These are technically dictionary words ("fi" = music note, "fl" = abbreviation)
 # but when they appear before another fragment in PDF text, they're almost
 # always a ligature break.  We merge more aggressively for these.
 _LIGATURE_STANDALONE = {"fi", "fl", "ff", "ffi", "ffl", "st"}
 
+# The same fragments in every upper/lower-case spelling ("fi", "Fi", "FI",
+# …), so a token can be tested as-is without lowercasing it first.  No
+# other character lowercases to one of these letters.
+_LIGATURE_STANDALONE_CASES = frozenset(
+    "".join(spelling)
+    for fragment in _LIGATURE_STANDALONE
+    for spelling in product(*((c, c.upper()) for c in fragment))
+)
+
 
 def _has_ligature_boundary(core_a: str, core_b: str) -> bool:
     """
@@ -305,19 +704,13 @@ def _has_ligature_boundary(core_a: str, core_b: str) -> bool:
     ligature break.  This catches cases like "profi" + "table" where neither
     fragment is short enough for the general heuristic.
     """
-    lower_a = core_a.lower()
-    return any(lower_a.endswith(lig) for lig in _LIGATURE_ENDINGS)
-
-
-def _is_ligature_fragment(core: str) -> bool:
-    """
-    Return True if *core* is exactly a known standalone ligature fragment.
-    E.g. "fi", "fl", "ff".  These override the "both are real words" safety
-    check because they almost never appear as actual words in PDF text.
-    """
-    return core.lower() in _LIGATURE_STANDALONE
+    for size, tails in _LIGATURE_TAILS:
+        if core_a[-size:].lower() in tails:
+            return True
+    return False
 
 
+@functools.lru_cache(maxsize=16384)
 def _clean_line(line: str) -> str:
     """
     Process a single line of text, merging broken-word fragments.
@@ -331,73 +724,164 @@ def _clean_line(line: str) -> str:
        (fi, fl, ff, …) regardless of length, and A+B is a dictionary word.
 
     Handles trailing punctuation (e.g. "fi le." → "file.").
+
+    Memoized: running headers, footers, page numbers and blank lines repeat
+    on every page, and the result depends only on the line itself.
+    """
+    # Split every token into (pre, core, suf) in one regex sweep and keep the
+    # parts as parallel lists, so each token is stripped exactly once.
+    if line.isascii():
+        token_re = _ASCII_TOKEN_RE
+    elif _NUMERIC_NON_DIGITS.isdisjoint(line):
+        token_re = _TOKEN_RE
+    else:
+        token_re = _EXACT_TOKEN_RE
+    pieces, pres, cores, sufs, gaps = zip(*token_re.findall(line + " "))
+    merged = _merge_fragments(pieces, pres, cores, sufs, gaps)
+    # Drop the extra space the scan appended to the line.
+    return line if merged is None else "".join(merged)[:-1]
+
+
+def _merge_fragments(
+    pieces: tuple[str, ...],
+    pres: tuple[str, ...],
+    cores: tuple[str, ...],
+    sufs: tuple[str, ...],
+    gaps: tuple[str, ...],
+) -> list[str] | None:
     """
-    tokens = line.split(" ")
+    The sliding-window scan behind :func:`_clean_line`, over a line that has
+    already been split into parallel (pre, core, suf, gap) sequences;
+    *pieces* are the tokens with their gaps, exactly as in the line.
+
+    Fragments are only merged across a single space.  Returns the output
+    pieces, or ``None`` when nothing was merged — the common case, which then
+    needs no list building or re-joining at all.
+    """
+    # Hot-loop helpers bound to locals: each module-global lookup in the loop
+    # body is a dict probe per use.
+    should_merge = _should_merge
+    word = is_word
+    ligature_fragments = _LIGATURE_STANDALONE_CASES
+    n = len(pieces)
+    # Core lengths, computed once.  The 3-token merge needs a fragment of
+    # ≤4 chars in the window and the general 2-token merge one of ≤3, so
+    # windows of long words skip straight past those branches.
+    lens = list(map(len, cores))
+    # Output so far, and how many input pieces it covers.  Untouched pieces
+    # are copied over in bulk (one slice) when the next merge happens.
     result: list[str] = []
+    done = 0
     i = 0
 
-    while i < len(tokens):
-        merged = False
-
-        # --- Try 3-token merge first (e.g. "di ffi cult" → "difficult") ---
-        if i + 2 < len(tokens):
-            pre_a, core_a, suf_a = _strip_punctuation(tokens[i])
-            pre_b, core_b, suf_b = _strip_punctuation(tokens[i + 1])
-            pre_c, core_c, suf_c = _strip_punctuation(tokens[i + 2])
-            # Only the first token may have leading punct, middle must be clean,
-            # last may have trailing punct.
-            if (_is_fragment(core_a) and not suf_a
-                    and _is_fragment(core_b) and not pre_b and not suf_b
-                    and _is_fragment(core_c) and not pre_c):
-                if _should_merge([core_a, core_b, core_c], max_short=4):
-                    merged_word = core_a + core_b + core_c
-                    log.debug(f"Triple merge: '{core_a} {core_b} {core_c}' → '{merged_word}'")
-                    result.append(pre_a + merged_word + suf_c)
-                    i += 3
-                    merged = True
-
-        # --- Try 2-token merge (e.g. "fi rst" → "first", "fi le." → "file.") ---
-        if not merged and i + 1 < len(tokens):
-            pre_a, core_a, suf_a = _strip_punctuation(tokens[i])
-            pre_b, core_b, suf_b = _strip_punctuation(tokens[i + 1])
-            # First token may have leading punct, second may have trailing punct.
-            # No punct should appear between the two cores.
-            if (_is_fragment(core_a) and not suf_a
-                    and _is_fragment(core_b) and not pre_b):
+    while i < n:
+        width = 0
+        core_a = cores[i]
+
+        # Every merge needs a clean fragment on the left with no trailing
+        # punct, followed by a single space and a next token.  The window's
+        # shared elements are read once here and reused by both merge sizes.
+        if core_a and not sufs[i] and gaps[i] == " " and i + 1 < n:
+            core_b = cores[i + 1]
+            len_a = lens[i]
+            len_b = lens[i + 1]
+            # No punct may appear between the first two cores.
+            b_ok = not pres[i + 1] and core_b
+
+            # --- Try 3-token merge first (e.g. "di ffi cult" → "difficult") ---
+            if b_ok and i + 2 < n and (len_a <= 4 or len_b <= 4 or lens[i + 2] <= 4):
+                core_c = cores[i + 2]
+                # Only the first token may have leading punct, middle must be
+                # clean, last may have trailing punct.
+                if (not sufs[i + 1] and gaps[i + 1] == " "
+                        and core_c and not pres[i + 2]):
+                    if should_merge((core_a, core_b, core_c), 4):
+                        merged_word = core_a + core_b + core_c
+                        log.debug(f"Triple merge: '{core_a} {core_b} {core_c}' → '{merged_word}'")
+                        replacement = pres[i] + merged_word + sufs[i + 2] + gaps[i + 2]
+                        width = 3
+
+            # --- Try 2-token merge (e.g. "fi rst" → "first", "fi le." → "file.") ---
+            # Second token may have trailing punct.
+            if not width and b_ok:
                 # General short-fragment merge
-                if _should_merge([core_a, core_b], max_short=3):
+                if (len_a <= 3 or len_b <= 3) and should_merge((core_a, core_b), 3):
                     merged_word = core_a + core_b
                     log.debug(f"Merge: '{core_a} {core_b}' → '{merged_word}'")
-                    result.append(pre_a + merged_word + suf_b)
-                    i += 2
-                    merged = True
+                    width = 2
                 # Ligature fragment override — "fi", "fl", "ff" etc. are
                 # technically dictionary words but in PDF context they're
                 # almost always broken ligatures.  Merge if A+B is a word.
-                elif _is_ligature_fragment(core_a) and is_word(core_a + core_b):
+                elif core_a in ligature_fragments and word(core_a + core_b):
                     merged_word = core_a + core_b
                     log.debug(f"Ligature fragment merge: '{core_a} {core_b}' → '{merged_word}'")
-                    result.append(pre_a + merged_word + suf_b)
-                    i += 2
-                    merged = True
+                    width = 2
                 # Ligature-aware merge — handles longer fragments like
                 # "profi" + "table" where neither side is ≤3 chars
                 elif _has_ligature_boundary(core_a, core_b):
-                    candidate = core_a + core_b
-                    if is_word(candidate) and not is_word(core_a):
-                        log.debug(f"Ligature merge: '{core_a} {core_b}' → '{candidate}'")
-                        result.append(pre_a + candidate + suf_b)
-                        i += 2
-                        merged = True
-
-        if not merged:
-            result.append(tokens[i])
+                    merged_word = core_a + core_b
+                    if word(merged_word) and not word(core_a):
+                        log.debug(f"Ligature merge: '{core_a} {core_b}' → '{merged_word}'")
+                        width = 2
+                if width:
+                    replacement = pres[i] + merged_word + sufs[i + 1] + gaps[i + 1]
+
+        if width:
+            result += pieces[done:i]
+            result.append(replacement)
+            i += width
+            done = i
+        else:
             i += 1
 
-    return " ".join(result)
+    if not done:
+        return None
+    result += pieces[done:]
+    return result
+
+
+# Texts with fewer lines are cleaned in-process by clean_broken_words():
+# a line takes ~20 µs, while starting a pool and pickling the chunks costs
+# ~40–80 ms, so the pool only pays for itself from a few thousand lines.
+_MIN_PARALLEL_LINES = 4000
 
+# Tasks per worker process in clean_broken_words() — a few each, so one
+# slow chunk doesn't leave the other workers idle at the end.
+_TASKS_PER_WORKER = 4
 
-def clean_broken_words(text: str) -> str:
+
+def _init_worker_dictionary() -> None:
+    """Process-pool initializer: load the dictionary once per worker."""
+    get_dictionary()
+
+
+@contextlib.contextmanager
+def _gc_frozen() -> Iterator[None]:
+    """
+    Keep everything alive now — the dictionary above all — out of the garbage
+    collector's reach while a process pool forks workers from this process.
+
+    A full collection traverses every entry of a Python set (~0.15 s a pass
+    for the expanded dictionary), and doing so in a worker un-shares the
+    dictionary's pages with the parent.  The parent's objects are handed back
+    to the collector when the pool is done; if the host application froze
+    objects itself, it manages the permanent generation and this is a no-op.
+    """
+    if gc.get_freeze_count():
+        yield
+        return
+    gc.freeze()
+    try:
+        yield
+    finally:
+        gc.unfreeze()
+
+
+def _clean_lines(lines: list[str]) -> list[str]:
+    return [_clean_line(line) for line in lines]
+
+
+def clean_broken_words(text: str, num_workers: int = 1) -> str:
     """
     Repair words that were split by erroneous spaces during PDF extraction.
 
@@ -410,6 +894,11 @@ def clean_broken_words(text: str) -> str:
     - Their concatenation IS a recognized English word.
 
     This avoids falsely merging legitimate short words like "a way" or "I do".
+
+    Lines are independent, so with *num_workers* above 1, texts of
+    ``_MIN_PARALLEL_LINES`` lines or more are cleaned in chunks across that
+    many processes.  The default is in-process: the pool is opt-in, since
+    under the ``spawn`` start method every worker loads the dictionary anew.
     """
     # First normalize Unicode ligatures (ﬁ → fi, ﬂ → fl, etc.)
     text = normalize_ligatures(text)
@@ -420,18 +909,87 @@ def clean_broken_words(text: str) -> str:
         return text
 
     lines = text.split("\n")
-    cleaned_lines = [_clean_line(line) for line in lines]
+    if num_workers <= 1 or len(lines) < _MIN_PARALLEL_LINES:
+        # map() drives the (C-level) memoized _clean_line with no Python
+        # loop or intermediate list in between.
+        cleaned = "\n".join(map(_clean_line, lines))
+        log.debug(f"Merge decision cache: {_should_merge.cache_info()}")
+        return cleaned
+
+    # The dictionary was loaded above, before the pool starts: forked
+    # workers share it copy-on-write, and their initializer is a no-op.
+    size = max(1, len(lines) // (_TASKS_PER_WORKER * num_workers))
+    chunks = [lines[k:k + size] for k in range(0, len(lines), size)]
+    with _gc_frozen(), ProcessPoolExecutor(
+        max_workers=min(num_workers, len(chunks)),
+        initializer=_init_worker_dictionary,
+    ) as executor:
+        cleaned_lines = [line for chunk in executor.map(_clean_lines, chunks) for line in chunk]
     return "\n".join(cleaned_lines)
 
 
+def _clean_page(page: str) -> str:
+    return "\n".join(map(_clean_line, normalize_ligatures(page).split("\n")))
+
+
+def iter_clean_broken_words(pages: Iterable[str], num_workers: int = 1) -> Iterator[str]:
+    """
+    Streaming form of :func:`clean_broken_words`: yield each of *pages* with
+    its broken words repaired, so a whole document is never held at once.
+
+    With more than one worker and at least ``_MIN_PARALLEL_LINES`` lines in
+    all, pages are cleaned in a process pool with at most ``2 * num_workers``
+    of them in flight.
+    """
+    if not get_dictionary():
+        log.warning("Dictionary is empty — skipping broken-word repair")
+        yield from map(normalize_ligatures, pages)
+        return
+
+    pages = iter(pages)
+    head: list[str] = []
+    if num_workers > 1:
+        # Read ahead until the pool would pay off; shorter texts run out
+        # first and are cleaned in-process, as in clean_broken_words().
+        lines = 0
+        for page in pages:
+            head.append(page)
+            lines += page.count("\n") + 1
+            if lines >= _MIN_PARALLEL_LINES:
+                break
+        else:
+            num_workers = 1
+    pages = chain(head, pages)
+    if num_workers <= 1:
+        yield from map(_clean_page, pages)
+        return
+
+    with _gc_frozen(), ProcessPoolExecutor(max_workers=num_workers, initializer=_init_worker_dictionary) as executor:
+        yield from _bounded_map(executor, _clean_page, pages, limit=2 * num_workers)
+
+
+# Horizontal whitespace that isn't already a single space.  Ordinary word
+# gaps don't match, so they cost nothing to substitute.
+_SPACE_RUN_RE = re.compile(r"[^\S\n]{2,}|[^\S \n]")
+# The same for pure-ASCII text, with the horizontal whitespace spelled out
+# (``str.isspace`` also counts the \x1c–\x1f separators, which ``re.ASCII``'s
+# ``\s`` would miss): a plain character set instead of a Unicode category
+# test on every character.
+_ASCII_SPACE_RUN_RE = re.compile(r"[\t\x0b\x0c\r\x1c-\x1f ]{2,}|[\t\x0b\x0c\r\x1c-\x1f]")
+
+# Newline runs (once spaces are collapsed) that need rewriting — a space
+# before a newline, or two or more newlines — replaced by their first one or
+# two newlines.
+_NEWLINE_RUN_RE = re.compile(r"(?= \n|\n ?\n) ?(\n)(?: ?(\n)(?: ?\n)*)?")
+
+
 def clean_extra_whitespace(text: str) -> str:
     """Normalize runs of whitespace: collapse multiple spaces, trim lines."""
     # Collapse multiple spaces (but not newlines) into one
-    text = re.sub(r"[^\S\n]+", " ", text)
-    # Remove trailing whitespace on each line
-    text = re.sub(r" +\n", "\n", text)
-    # Collapse 3+ newlines into 2
-    text = re.sub(r"\n{3,}", "\n\n", text)
+    space_run_re = _ASCII_SPACE_RUN_RE if text.isascii() else _SPACE_RUN_RE
+    text = space_run_re.sub(" ", text)
+    # Remove trailing whitespace on each line and collapse 3+ newlines into 2
+    text = _NEWLINE_RUN_RE.sub(r"\1\2", text)
     return text.strip()
 
 
@@ -442,6 +1000,7 @@ def clean_extra_whitespace(text: str) -> str:
 def extract_and_clean_pdf(
     pdf_path: str | Path,
     page_range: tuple[int, int] | None = None,
+    num_workers: int = _DEFAULT_WORKERS,
 ) -> str:
     """
     One-step PDF → cleaned text.
@@ -449,8 +1008,13 @@ def extract_and_clean_pdf(
     Extracts text from *pdf_path*, repairs broken words, and normalizes
     whitespace — ready for an audiobook TTS reader.
     """
-    raw = extract_text_from_pdf(pdf_path, page_range=page_range)
-    cleaned = clean_broken_words(raw)
+    # Pages flow from the extractor through the word repair one at a time;
+    # only the cleaned text is ever assembled in full.  Extraction is by far
+    # the slower stage, so it gets the worker processes and the cleaning runs
+    # here as its pages arrive — never a second pool forking alongside the
+    # first one's manager thread.
+    pages = iter_pdf_pages(pdf_path, page_range=page_range, num_workers=num_workers)
+    cleaned = "\n\n".join(iter_clean_broken_words(pages, num_workers=1))
     cleaned = clean_extra_whitespace(cleaned)
     return cleaned
 
@@ -475,6 +1039,12 @@ def main():
         "-o", "--output",
         help="Output file path (default: stdout)",
     )
+    parser.add_argument(
+        "-j", "--jobs",
+        type=int,
+        default=_DEFAULT_WORKERS,
+        help=f"Worker processes for PDF extraction (default: {_DEFAULT_WORKERS}; 1 disables the pool)",
+    )
     args = parser.parse_args()
 
     logging.basicConfig(
@@ -488,7 +1058,7 @@ def main():
         parts = args.pages.split("-")
         page_range = (int(parts[0]), int(parts[1]))
 
-    cleaned = extract_and_clean_pdf(args.pdf, page_range=page_range)
+    cleaned = extract_and_clean_pdf(args.pdf, page_range=page_range, num_workers=args.jobs)
 
     if args.output:
         out = Path(args.output)
@@ -1,9 +1,15 @@
 """Tests for pdf_text_cleanup module."""
 
+import os
+import pickle
+import sys
 import textwrap
+from pathlib import Path
+
+import pdf_text_cleanup
 from pdf_text_cleanup import (
-    clean_broken_words, clean_extra_whitespace, is_word,
-    normalize_ligatures,
+    _expand_cached, _iter_pages, clean_broken_words, clean_extra_whitespace,
+    is_word, iter_clean_broken_words, normalize_ligatures,
 )
 
 
@@ -16,6 +22,66 @@ def test_dictionary_loads():
     assert not is_word("xyzzyplugh")
 
 
+def test_expanded_dictionary_cache(monkeypatch, tmp_path):
+    """
+    The second expansion of the same word list is read back from disk, and
+    writing a cache file removes those left by other word lists.
+    """
+    monkeypatch.setattr(pdf_text_cleanup, "_CACHE_DIR", tmp_path)
+    monkeypatch.delenv("ASTRO_DICT_CACHE", raising=False)
+    stale = tmp_path / "dict-0000000000000000.pkl"
+    stale.write_bytes(pickle.dumps({"stale"}))
+    other_kind = tmp_path / "dict-0000000000000000.marisa"
+    other_kind.write_bytes(b"")
+    expanded = _expand_cached({"walk", "file"})
+    assert {"walks", "walking", "filing"} <= expanded
+    assert not stale.exists()
+    assert other_kind.exists()
+    (cache_file,) = tmp_path.glob("dict-*.pkl")
+    cache_file.write_bytes(pickle.dumps({"sentinel"}))
+    assert _expand_cached({"walk", "file"}) == {"sentinel"}
+
+
+def test_trie_dictionary_cache(monkeypatch, tmp_path):
+    """With marisa-trie, the expansion is saved as a trie and mmapped back."""
+    import pytest
+    marisa_trie = pytest.importorskip("marisa_trie")
+    monkeypatch.setattr(pdf_text_cleanup, "_CACHE_DIR", tmp_path)
+    monkeypatch.delenv("ASTRO_DICT_CACHE", raising=False)
+    trie = pdf_text_cleanup._trie_cached({"walk", "file"})
+    assert "walking" in trie and "filing" in trie
+    (cache_file,) = tmp_path.glob("dict-*.marisa")
+    marisa_trie.Trie(["sentinel"]).save(str(cache_file))
+    cached = pdf_text_cleanup._trie_cached({"walk", "file"})
+    assert "sentinel" in cached
+    assert "walking" not in cached
+
+
+def test_dictionary_cache_can_be_disabled(monkeypatch, tmp_path):
+    """ASTRO_DICT_CACHE=0 expands in memory and leaves no cache file."""
+    monkeypatch.setattr(pdf_text_cleanup, "_CACHE_DIR", tmp_path)
+    monkeypatch.setenv("ASTRO_DICT_CACHE", "0")
+    assert "walking" in _expand_cached({"walk"})
+    assert not any(tmp_path.iterdir())
+
+
+def test_prebuilt_dictionary_asset(monkeypatch, tmp_path):
+    """A written asset is loaded as-is, without the base word list."""
+    monkeypatch.setattr(pdf_text_cleanup, "_load_base_words", lambda: {"walk", "file"})
+    asset = tmp_path / "d.pkl"
+    assert pdf_text_cleanup.write_dictionary_asset(asset) > 2
+    monkeypatch.setattr(pdf_text_cleanup, "_DICT_ASSET", asset)
+    monkeypatch.setattr(pdf_text_cleanup, "_TRIE_ASSET", tmp_path / "missing.marisa")
+
+    def no_base_words():
+        raise AssertionError("base word list loaded despite the asset")
+
+    monkeypatch.setattr(pdf_text_cleanup, "_load_base_words", no_base_words)
+    dictionary = pdf_text_cleanup._load_dictionary()
+    assert isinstance(dictionary, frozenset)
+    assert dictionary == pdf_text_cleanup._expand_with_inflections({"walk", "file"})
+
+
 # ---- Ligature-style broken words (short-left fragment) ----
 
 def test_fi_ligature_break():
@@ -41,6 +107,13 @@ def test_fi_in_sentence():
     assert "fi le" not in cleaned
 
 
+def test_capitalized_ligature_fragment():
+    """Capitalized and upper-case fragments merge like lower-case ones."""
+    assert clean_broken_words("Fi rst") == "First"
+    assert clean_broken_words("The Fi eld") == "The Field"
+    assert clean_broken_words("FI RST") == "FIRST"
+
+
 def test_ffi_ligature_triple():
     """Triple-fragment merge: 'di ffi cult' → 'difficult'."""
     result = clean_broken_words("This is di ffi cult to read.")
@@ -80,6 +153,17 @@ def test_preserves_i_do():
     assert "I do" in result
 
 
+def test_preserves_space_runs():
+    """Runs of spaces around a merge are kept exactly as they were."""
+    assert clean_broken_words("a  fi rst") == "a  first"
+    assert clean_broken_words("the fi rst  time") == "the first  time"
+
+
+def test_no_merge_across_space_run():
+    """Fragments separated by more than one space are left alone."""
+    assert clean_broken_words("fi  rst") == "fi  rst"
+
+
 # ---- Whitespace cleanup ----
 
 def test_collapse_multiple_spaces():
@@ -97,6 +181,24 @@ def test_trim_trailing_spaces():
     assert result == "hello\nworld"
 
 
+def test_collapse_newlines_with_spaces():
+    """Spaces between newlines don't stop a newline run from collapsing."""
+    assert clean_extra_whitespace("a \n \n \nb") == "a\n\nb"
+
+
+def test_collapse_tabs():
+    assert clean_extra_whitespace("a\t\tb") == "a b"
+
+
+def test_carriage_return_before_newline():
+    assert clean_extra_whitespace("a\r\nb") == "a\nb"
+
+
+def test_ascii_separator_is_whitespace():
+    """\\x1c–\\x1f count as spaces, as str.isspace has it (re.ASCII's \\s doesn't)."""
+    assert clean_extra_whitespace("a\x1cb") == "a b"
+
+
 # ---- Full pipeline on realistic text block ----
 
 def test_realistic_paragraph():
@@ -178,6 +280,12 @@ def test_ligature_merge_with_punctuation():
     assert "profitable." in result
 
 
+def test_merge_keeps_footnote_superscript():
+    """A superscript footnote marker is trailing punctuation, not a letter."""
+    result = clean_broken_words("See the fi rst² example.")
+    assert "first²" in result
+
+
 # ---- Allen 2009 style text ----
 
 def test_allen2009_paragraph():
@@ -199,6 +307,55 @@ def test_allen2009_paragraph():
     assert "fi gures" not in cleaned
 
 
+# ---- Process pool ----
+
+_LONG_TEXT = "\n".join(
+    f"Line {n}: the fi rst di ffi cult fi le was profi table."
+    for n in range(pdf_text_cleanup._MIN_PARALLEL_LINES + 200)
+)
+
+
+def test_pool_matches_serial():
+    """Long texts go through the process pool with the same result."""
+    serial = clean_broken_words(_LONG_TEXT, num_workers=1)
+    assert "the first difficult file was profitable." in serial
+    assert clean_broken_words(_LONG_TEXT, num_workers=2) == serial
+
+
+def _long_text_pages() -> list[str]:
+    lines = _LONG_TEXT.split("\n")
+    return ["\n".join(lines[k:k + 100]) for k in range(0, len(lines), 100)]
+
+
+def test_iter_clean_matches_clean_broken_words():
+    """Streamed pages are cleaned like whole texts, in-process or pooled."""
+    pages = _long_text_pages()
+    expected = [clean_broken_words(page, num_workers=1) for page in pages]
+    assert list(iter_clean_broken_words(pages, num_workers=1)) == expected
+    assert list(iter_clean_broken_words(iter(pages), num_workers=2)) == expected
+
+
+def test_iter_clean_short_text_skips_pool(monkeypatch):
+    """A few pages are cleaned in-process even when workers are allowed."""
+    monkeypatch.setattr(pdf_text_cleanup, "ProcessPoolExecutor", None)
+    pages = _long_text_pages()[:3]
+    expected = [clean_broken_words(page, num_workers=1) for page in pages]
+    assert list(iter_clean_broken_words(pages, num_workers=2)) == expected
+
+
+def _numbered_pages(pdf_path, first, stop):
+    return (f"page {n}" for n in range(first, stop))
+
+
+def test_iter_pages_pool_matches_serial(monkeypatch):
+    """Pooled page batches come back complete and in page order."""
+    monkeypatch.setattr(pdf_text_cleanup, "_page_count", lambda backend, pdf_path: 123)
+    expected = [f"page {n}" for n in range(5, 123)]
+    for num_workers in (1, 3):
+        pages = _iter_pages("test", _numbered_pages, Path("test.pdf"), 5, sys.maxsize, num_workers)
+        assert list(pages) == expected
+
+
 # ---- Edge cases ----
 
 def test_empty_string():
@@ -218,12 +375,15 @@ def test_single_character_word():
 
 
 if __name__ == "__main__":
-    import sys
     # Run tests manually if pytest isn't available
+    os.environ["ASTRO_DICT_CACHE"] = "0"
     test_funcs = [v for k, v in sorted(globals().items()) if k.startswith("test_")]
     passed = 0
     failed = 0
     for fn in test_funcs:
+        if fn.__code__.co_argcount:
+            print(f"  SKIP  {fn.__name__} (needs pytest fixtures)")
+            continue
         try:
             fn()
             print(f"  PASS  {fn.__name__}")